@@ -0,0 +1,43 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to plain NumPy versions of the kernels
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mul3(a, b, c):
+        """Elementwise product of three equal-length arrays"""
+        out = np.empty_like(a)
+        for i in range(a.size):
+            out[i] = a[i] * b[i] * c[i]
+        return out
+else:
+    def _mul3(a, b, c):
+        """Elementwise product of three equal-length arrays"""
+        return a * b * c
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _band_rates(flux, sky, throughput, dlam):
+        """Integrates an object photon rate spectrum <flux> and a sky photon
+        rate spectrum <sky> through <throughput> on bins of width <dlam>.
+        Returns the (object, sky) photon rates"""
+        signal = 0.0
+        background = 0.0
+        for i in range(flux.size):
+            weight = throughput[i] * dlam[i]
+            signal += flux[i] * weight
+            background += sky[i] * weight
+        return signal, background
+else:
+    def _band_rates(flux, sky, throughput, dlam):
+        """Integrates an object photon rate spectrum <flux> and a sky photon
+        rate spectrum <sky> through <throughput> on bins of width <dlam>.
+        Returns the (object, sky) photon rates"""
+        weights = throughput * dlam
+        return np.dot(flux, weights), np.dot(sky, weights)
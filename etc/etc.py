@@ -22,6 +22,7 @@ from synphot.observation import Observation
 
 from . import data
 from .models import Site, Telescope, Instrument
+from ._kernels import _band_rates
 from .config import conf
 from .utils import sptype_to_pickles_standard, ETCError
 
@@ -325,6 +326,85 @@ class ETC(object):
 
         return snr
 
+    def ccd_snr_batch(self, exp_time, V_mags, filternames=None, source_spec=None,
+                      sky_mag=None, darkcurrent_rate=0 * (u.ph / u.pixel / u.s)):
+        """Calculate the SNR in a given exposure time <exp_time> for each of the
+        <V_mags> in each of the [filternames] (defaults to all of the instrument's
+        filters). The photon rates for all filters are computed in one pass
+        over the instrument's throughput matrix on its internal wavelength grid
+        rather than through a synphot Observation per filter and magnitude.
+        The sky is normalized to [sky_mag] if given, otherwise to the Site's
+        sky magnitude for each filter.
+        Returns a (n_filters, n_mags) array of SNR values (with no rows if
+        there are no filters)
+        """
+
+        if filternames is None:
+            filternames = self.instrument.filterlist
+        elif isinstance(filternames, str):
+            filternames = [filternames,]
+        for filtername in filternames:
+            if filtername not in self.instrument.filterlist:
+                raise ETCError('Filter name {0} is invalid.'.format(filtername))
+
+        try:
+            exp_time = exp_time.to(u.s).value
+        except AttributeError:
+            pass
+        V_mags = np.atleast_1d(V_mags).astype(np.float64)
+
+        source_spec = source_spec or self._vega
+        if type(source_spec) != SourceSpectrum:
+            raise ETCError('Invalid sourcespec; must be a SourceSpectrum')
+
+        tp = self.instrument._build_throughput_matrix(filternames)
+        waves = self.instrument._wavelengths
+        dlam = np.gradient(waves.to_value(u.AA))
+        area = self.telescope.area.to_value(units.AREA)
+        telescope = self.telescope.reflectivity(waves).value
+        atmos = self.site.transmission(waves).value
+
+        # Object photons/s/AA for V=0; other magnitudes scale from this
+        source_norm = source_spec.normalize(0*units.VEGAMAG, self._map_filter_to_standard('V'), vegaspec=self._vega)
+        source_rate = source_norm(waves, flux_unit=units.PHOTLAM).value * telescope * atmos * area
+
+        sky_flux = np.empty_like(tp)
+        readnoise = np.empty(len(filternames))
+        pixel_area = np.empty(len(filternames))
+        npix = np.empty(len(filternames))
+        for row, filtername in enumerate(filternames):
+            sky_filtername = self._convert_filtername(filtername)
+            filter_sky_mag = sky_mag if sky_mag is not None else self.site.sky_mags.get(sky_filtername, None)
+            if filter_sky_mag is None:
+                raise ETCError('Could not determine a valid sky magnitude for filter: {0}'.format(sky_filtername))
+            sky = self.site.sky_spectrum(sky_filtername)
+            sky_norm = sky.normalize(filter_sky_mag*units.VEGAMAG, self._map_filter_to_standard(sky_filtername), vegaspec=self._vega)
+            sky_flux[row] = sky_norm(waves, flux_unit=units.PHOTLAM).value
+
+            camera = self.instrument._camera_for_filter(filtername)
+            readnoise[row] = camera.ccd_readnoise.value
+            pixel_scale = (camera.ccd_pixscale * camera.ccd_xbinning).to_value(u.arcsec)
+            pixel_area[row] = pixel_scale * pixel_scale
+            npix[row] = round(np.pi*(self.instrument.fwhm.to_value(u.arcsec) / pixel_scale)**2)
+
+        # Object (for V=0) and sky photon rates in each filter; the sky doesn't
+        # depend on the object magnitude so is only integrated once per filter
+        signal_V0 = np.empty(len(filternames))
+        sky_pixel_rate = np.empty(len(filternames))
+        for row in range(len(filternames)):
+            # Sky photons/s/AA per pixel (no atmosphere, as in ccd_snr())
+            sky_rate = sky_flux[row] * telescope * area * pixel_area[row]
+            signal_V0[row], sky_pixel_rate[row] = _band_rates(source_rate, sky_rate, tp[row], dlam)
+
+        # The object signal scales as 10**(-0.4*mag) so all magnitudes are done at once
+        sobj2 = signal_V0[:, np.newaxis] * 10**(-0.4*V_mags) * exp_time
+        ssky2 = (sky_pixel_rate * exp_time)[:, np.newaxis]
+        dark_count = darkcurrent_rate.to_value(u.photon/u.pix/u.s) * exp_time
+        readnoise_sq = (readnoise * readnoise)[:, np.newaxis]
+        snr = self._compute_snr(sobj2, ssky2, npix[:, np.newaxis], dark_count, readnoise_sq)
+
+        return snr
+
     def exptime_from_ccd_snr(self, snr, V_mag, filtername, npix=1 * u.pixel,
                          n_background=np.inf * u.pixel,
                          background_rate=0 * (u.ct / u.pixel / u.s),
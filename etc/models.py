@@ -1,8 +1,12 @@
 import os
 import sys
+import copy
 import numbers
 import warnings
+import functools
 from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     if sys.version_info >= (3, 9):
@@ -15,6 +19,11 @@ except ImportError:
     import importlib_resources as pkg_resources
 
 import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is optional; ASCII files are read with synphot's reader without it
+    pd = None
 from astropy import units as u
 from astropy.table import QTable
 from astropy.io.ascii import InconsistentTableError
@@ -24,14 +33,88 @@ from synphot.spectrum import BaseUnitlessSpectrum, Empirical1D
 from synphot.observation import Observation
 
 from .config import conf
-from .utils import ETCError, read_element
+from ._kernels import _mul3
+from .utils import ETCError, read_element, read_lco_filter_csv
 
 __all__ = ['Site', 'Telescope', 'Instrument']
 
 
+# Resolve the package data directory once rather than on every file lookup
+_DATA_ROOT = pkg_resources.files('etc.data')
+
+# Common wavelength grid for constant spectra and resampled throughputs.
+# Shared between all components so it is made read-only.
+_DEFAULT_WL_NM = np.arange(300, 1501, dtype=np.float64)
+_DEFAULT_WL_GRID = _DEFAULT_WL_NM * u.nm
+_DEFAULT_WL_NM.flags.writeable = False
+_DEFAULT_WL_GRID.flags.writeable = False
+
+# Maximum number of threads used to read an Instrument's filters
+_FILTER_LOAD_WORKERS = 8
+
+def _read_ascii_fast(path):
+    """Reads a two column (wavelength in nm, throughput) ASCII file with
+    pandas' C parser if available. Falls back to `specio.read_ascii_spec` if
+    pandas is not installed or the file is not plain whitespace-separated
+    numbers with '#' comments.
+    Returns an empty header dictionary and the wavelength and throughput columns"""
+
+    if pd is not None:
+        try:
+            data = pd.read_csv(path, sep=r'\s+', comment='#', header=None, engine='c',
+                               dtype=np.float64, memory_map=True).to_numpy()
+        except (ValueError, pd.errors.ParserError):
+            data = None
+        if data is not None and data.ndim == 2 and data.shape[1] >= 2:
+            return {}, data[:, 0] * u.nm, data[:, 1] * units.THROUGHPUT
+
+    return specio.read_ascii_spec(path, wave_unit=u.nm, flux_unit=units.THROUGHPUT)
+
+# Cached readers for filter profiles. The modification time of local files is
+# passed in as part of the cache key so that edited files are re-read.
+@functools.lru_cache(maxsize=128)
+def _load_ascii(path, mtime):
+    return _read_ascii_fast(path)
+
+@functools.lru_cache(maxsize=128)
+def _load_lco_csv(path, mtime):
+    return read_lco_filter_csv(path)
+
+@functools.lru_cache(maxsize=128)
+def _load_remote(url):
+    return specio.read_remote_spec(url, wave_unit=u.AA, flux_unit=units.THROUGHPUT)
+
+def _ipow(value, exponent):
+    """Returns <value>**<exponent>, by repeated multiplication for the small
+    non-negative integer element counts used in _compute_transmission()"""
+    if not isinstance(exponent, numbers.Integral) or exponent < 0:
+        return value**exponent
+    result = 1.0
+    for _ in range(exponent):
+        result *= value
+    return result
+
+def _flat_spectral_element(value):
+    """Returns a SpectralElement of constant <value> over the default grid"""
+    trans = np.full(_DEFAULT_WL_GRID.size, value, dtype=np.float64)
+    return SpectralElement(Empirical1D, points=_DEFAULT_WL_GRID, lookup_table=trans, keep_neg=True, meta={'header': {}})
+
+
 class Site:
     """Model for a site location and the atmosphere above it"""
 
+    # Flux (in Jy) for mag=0 in each filter; see _photon_rate()
+    _flux_janskys = {'U': 1790, 'B': 4063, 'V' : 3636, 'v' : 3583.05, 'R' : 3064, 'Rc' : 3028, 'I' : 2416, 'Ic' : 2458.33, 'Z' : 2200,
+                     'u' : 3631, 'g': 3631, 'r': 3631, 'i': 3631, 'z': 3631,
+                     'up' : 3631, 'gp': 3631, 'rp': 3631, 'ip': 3631, 'zp': 3631, 'w' : 3631}
+    # Central wavelength (in Angstroms) of each filter
+    _filter_cwave = {'U': 3600, 'B': 4300, 'V' : 5500, 'v' : 5513, 'R' : 6500, 'Rc' : 6358, 'I' : 8200, 'Ic' : 7869.4, 'Z' : 9500, 'Y' : 10020,
+                     'u' : 3675, 'g' : 4763, 'rp' : 6204, 'ip' : 7523, 'zp' : 8660, 'z' : 9724,
+                     'gp' : 4810, 'rp' : 6170, 'ip' : 7520, 'zp' : 8660, 'w' : 6080}
+
+    __slots__ = ('name', 'altitude', 'latitude', 'longitude', 'transmission',
+                 'sky_mags', 'sky_mags_table', 'radiance')
+
     def __init__(self, name=None, altitude=None, latitude= None, longitude=None, **kwargs):
         self.name = name if name is not None else "Undefined"
         self.altitude = altitude * u.m if altitude is not None else altitude
@@ -41,17 +124,17 @@ class Site:
             modelclass = Empirical1D
             try:
                 transmission = float(kwargs['transmission'])
-                wavelengths = np.arange(300, 1501, 1) * u.nm
-                throughput = len(wavelengths) * [transmission,]
+                wavelengths = _DEFAULT_WL_GRID
+                throughput = np.full(wavelengths.size, transmission, dtype=np.float64)
                 header = {}
                 self.transmission = BaseUnitlessSpectrum(modelclass, points=wavelengths, lookup_table=  throughput, keep_neg=False, meta={'header': header})
             except ValueError:
                 self.transmission = read_element(kwargs['transmission'])
-#                sky_file = str(pkg_resources.files('etc.data').joinpath(os.path.expandvars(kwargs['transmission'])))
+#                sky_file = str(_DATA_ROOT.joinpath(os.path.expandvars(kwargs['transmission'])))
         if 'sky_mag' in kwargs:
             self.sky_mags = kwargs['sky_mag']
         else:
-            file_path = pkg_resources.files('etc.data').joinpath(os.path.expandvars(conf.sky_brightness_file))
+            file_path = _DATA_ROOT.joinpath(os.path.expandvars(conf.sky_brightness_file))
             self.sky_mags_table = self._read_skybrightness_file(file_path)
             self.sky_mags = []
             if self.sky_mags_table:
@@ -151,10 +234,7 @@ class Site:
         for SDSS/PanSTARRS
         """
 
-        flux_janskys = {'U': 1790, 'B': 4063, 'V' : 3636, 'v' : 3583.05, 'R' : 3064, 'Rc' : 3028, 'I' : 2416, 'Ic' : 2458.33, 'Z' : 2200,
-                    'u' : 3631, 'g': 3631, 'r': 3631, 'i': 3631, 'z': 3631,
-                    'up' : 3631, 'gp': 3631, 'rp': 3631, 'ip': 3631, 'zp': 3631, 'w' : 3631}
-        flux_mag0_Jy = flux_janskys[filtername] * u.Jy
+        flux_mag0_Jy = self._flux_janskys[filtername] * u.Jy
         wavelength = self._map_filter_to_wavelength(filtername)
         m_0 = flux_mag0_Jy.to(u.photon / u.cm**2 / u.s / u.angstrom, equivalencies=u.spectral_density(wavelength))
 
@@ -164,10 +244,7 @@ class Site:
         """Maps the given [filtername] (defaults to 'V' for Bessell-V') to a wavelength
         which is returned as an AstroPy Quantity in angstroms"""
 
-        filter_cwave = {'U': 3600, 'B': 4300, 'V' : 5500, 'v' : 5513, 'R' : 6500, 'Rc' : 6358, 'I' : 8200, 'Ic' : 7869.4, 'Z' : 9500, 'Y' : 10020,
-                        'u' : 3675, 'g' : 4763, 'rp' : 6204, 'ip' : 7523, 'zp' : 8660, 'z' : 9724,
-                        'gp' : 4810, 'rp' : 6170, 'ip' : 7520, 'zp' : 8660, 'w' : 6080}
-        wavelength = filter_cwave[filtername] * u.angstrom
+        wavelength = self._filter_cwave[filtername] * u.angstrom
 
         return wavelength
 
@@ -187,7 +264,7 @@ class Site:
             other = other.reflectivity
         if isinstance(other, Instrument):
             other = other.transmission
-        newcls = self
+        newcls = copy.copy(self)
         newcls.transmission = self.transmission.__mul__(other)
         return newcls
 
@@ -195,7 +272,7 @@ class Site:
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        newcls = self
+        newcls = copy.copy(self)
         newcls.transmission = self.transmission.__truediv__(other)
         return newcls
 
@@ -207,6 +284,8 @@ class Site:
 
 
 class Telescope:
+    __slots__ = ('name', 'size', 'area_unit', 'area', 'num_mirrors', 'reflectivity')
+
     def __init__(self, name=None, size=0, area=0, num_mirrors=2, **kwargs):
         self.name = name if name is not None else "Undefined"
         self.size = size * u.m
@@ -220,29 +299,33 @@ class Telescope:
         reflectivity = kwargs.get('reflectivity',  0.85)
         try:
             reflectivity = float(reflectivity)
-            wavelengths = np.arange(300, 1501, 1) * u.nm
-            refl = len(wavelengths) * [reflectivity,]
+            wavelengths = _DEFAULT_WL_GRID
+            # Assume all mirrors are the same reflectivity and combine directly
+            refl = np.full(wavelengths.size, reflectivity, dtype=np.float64) ** self.num_mirrors
             header = {}
             mirror_se = BaseUnitlessSpectrum(modelclass, points=wavelengths, lookup_table=refl, keep_neg=True, meta={'header': header})
-            # Assume all mirrors are the same reflectivity and copy
-            for x in range(self.num_mirrors):
-                mirrors.append(mirror_se)
+            mirrors.append(mirror_se)
         except ValueError:
-            # single filename
+            # single filename; assume all mirrors are the same and raise the
+            # reflectivity table to the number of mirrors
             component =  kwargs['reflectivity']
             mirror_se = read_element(component)
-            for x in range(self.num_mirrors):
-                mirrors.append(mirror_se)
+            wavelengths, refl = mirror_se._get_arrays(None)
+            refl = refl.value ** self.num_mirrors
+            mirror_se = BaseUnitlessSpectrum(modelclass, points=wavelengths, lookup_table=refl, keep_neg=False, meta=dict(mirror_se.meta))
+            mirrors.append(mirror_se)
         except TypeError:
             # List of filename components
             telescope_components = kwargs['reflectivity']
+            if len(telescope_components) < self.num_mirrors:
+                raise ETCError('Only {0} reflectivity components given for {1} mirrors.'.format(len(telescope_components), self.num_mirrors))
             for component in telescope_components:
                 mirror_se = read_element(component)
                 mirrors.append(mirror_se)
         # Multiply mirror reflectivities together
         self.reflectivity = mirrors[0]
-        for x in range(0, self.num_mirrors-1):
-            self.reflectivity *= mirrors[x+1]
+        for mirror_se in mirrors[1:self.num_mirrors]:
+            self.reflectivity *= mirror_se
 
     def tpeak(self, wavelengths=None):
         """Calculate :ref:`peak bandpass throughput <synphot-formula-tpeak>`.
@@ -264,7 +347,7 @@ class Telescope:
         return self.reflectivity(x).max()
 
     def __mul__(self, other):
-        newcls = self
+        newcls = copy.copy(self)
         newcls.reflectivity = self.reflectivity.__mul__(other)
         return newcls
 
@@ -272,7 +355,7 @@ class Telescope:
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        newcls = self
+        newcls = copy.copy(self)
         newcls.reflectivity = self.reflectivity.__truediv__(other)
         return newcls
 
@@ -283,10 +366,89 @@ class Telescope:
         return "{} (M1: {} diameter, {} area; {} mirrors)".format(self.name, self.size.to(u.m), self.area.to(self.area_unit), self.num_mirrors)
 
 
+def _map_filtername(filtername):
+    """Returns the config mapping key for <filtername> (prime filters e.g.
+    'rp' use the unprimed profile). Raises ETCError if there is no mapping"""
+
+    if len(filtername) == 2 and filtername[1] == 'p':
+        filtername = filtername[0]
+    if filtername not in conf.mapping:
+        raise ETCError('Filter name {0} is invalid.'.format(filtername))
+    return filtername
+
+
+class _LazyFilterDict(MutableMapping):
+    """Ordered mapping of filter name to bandpass where each bandpass is only
+    made by calling <loader> with the filter name when it is first accessed"""
+
+    def __init__(self, loader, filternames=()):
+        self._loader = loader
+        self._bandpasses = OrderedDict()
+        for filtername in filternames:
+            self.add(filtername)
+
+    def add(self, filtername):
+        """Adds <filtername> without loading it. Raises ETCError if the
+        filter is not in the config mapping"""
+        _map_filtername(filtername)
+        self._bandpasses.setdefault(filtername, None)
+
+    def load(self, filternames):
+        """Loads any of <filternames> not yet accessed. The reads are I/O bound
+        (and the SVO ones go over the network) so they are done in a thread pool"""
+
+        pending = [f for f in OrderedDict.fromkeys(filternames) if self._bandpasses[f] is None]
+        if len(pending) == 0:
+            return
+        with ThreadPoolExecutor(max_workers=min(_FILTER_LOAD_WORKERS, len(pending))) as ex:
+            for filtername, bandpass in zip(pending, ex.map(self._loader, pending)):
+                self._bandpasses[filtername] = bandpass
+
+    def load_all(self):
+        """Loads all filters not yet accessed"""
+        self.load(self._bandpasses)
+
+    def __getitem__(self, filtername):
+        bandpass = self._bandpasses[filtername]
+        if bandpass is None:
+            bandpass = self._loader(filtername)
+            self._bandpasses[filtername] = bandpass
+        return bandpass
+
+    def __setitem__(self, filtername, bandpass):
+        self._bandpasses[filtername] = bandpass
+
+    def __delitem__(self, filtername):
+        del self._bandpasses[filtername]
+
+    def __contains__(self, filtername):
+        return filtername in self._bandpasses
+
+    def __iter__(self):
+        return iter(self._bandpasses)
+
+    def __len__(self):
+        return len(self._bandpasses)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self._bandpasses))
+
+
 class Instrument:
     adc_error = np.sqrt(0.289) * (u.adu / u.pixel)
     # Conversion factor from FWHM to Gaussian standard deviation sigma
     _fwhm2sigma = 2.0 * np.sqrt(2 * np.log(2))
+    # Filter SpectralElements shared between all Instrument instances, keyed
+    # by (filtername, resolved path, modification time)
+    _filter_cache = {}
+
+    __slots__ = ('name', 'inst_type', 'fiber_diameter', 'grating_linespermm', 'grating_spacing',
+                 'grating_blaze', 'grating_gamma', 'cam_focallength', 'dispersion_along_x',
+                 '_echelle_constant', 'num_ar_coatings', 'num_lenses', 'num_mirrors',
+                 'lens_trans', 'mirror_refl', 'ar_coating', 'transmission_scalar', '_transmission',
+                 'fwhm', 'focal_scale', '_num_channels', 'channelset', 'filter2channel_map',
+                 'filterlist', 'filterset', '_wavelengths', '_transmission_array', '_ccd_arrays',
+                 '_filter_arrays', '_tp_matrix', '_filter_index')
 
     def __init__(self, name=None, inst_type="IMAGER", **kwargs):
 
@@ -324,20 +486,23 @@ class Instrument:
 
         # Read common components first
         trans_components = kwargs.get('trans_components',  None)
-        wavelengths = np.arange(300, 1501, 1) * u.nm
+        wavelengths = _DEFAULT_WL_GRID
+        # Wavelength-independent transmission (None if built from components).
+        # In that case the SpectralElement is only made if `transmission` is used
+        self.transmission_scalar = None
+        self._transmission = None
         if trans_components:
-            trans = len(wavelengths) * [1.0,]
+            trans = np.ones(wavelengths.size, dtype=np.float64)
             for comp_name in trans_components.split(","):
                 print(comp_name)
                 element = read_element(comp_name.strip())
-                trans *= element(wavelengths)
+                trans = trans * element(wavelengths)
+            header = {}
+            self._transmission = SpectralElement(Empirical1D, points=wavelengths, lookup_table=trans,\
+                keep_neg=True, meta={'header': header})
         else:
             print("Computing transmission from elements")
-            transmission = self._compute_transmission()
-            trans = len(wavelengths) * [transmission,]
-        header = {}
-        self.transmission = SpectralElement(Empirical1D, points=wavelengths, lookup_table=trans,\
-            keep_neg=True, meta={'header': header})
+            self.transmission_scalar = float(self._compute_transmission())
 
         fwhm = kwargs.get('fwhm', 1)
         try:
@@ -363,11 +528,10 @@ class Instrument:
         self.filter2channel_map = OrderedDict()
 
         self.filterlist = kwargs.get('filterlist', [])
-        self.filterset = OrderedDict()
-        for filtername in self.filterlist:
-            if filtername not in self.filterset:
-                self.filterset[filtername] = self.set_bandpass_from_filter(filtername)
-                self.filter2channel_map[filtername] = 'default'
+        # Filters are only read from disk/SVO when they are first used
+        self.filterset = _LazyFilterDict(self.set_bandpass_from_filter, self.filterlist)
+        for filtername in self.filterset:
+            self.filter2channel_map[filtername] = 'default'
 
         for channel in channels:
             # Make copy of common params defined at the Instrument level and then
@@ -385,9 +549,44 @@ class Instrument:
             for filtername in cam_filterlist:
                 if filtername not in self.filterset:
                     self.filterlist.append(filtername)
-                    self.filterset[filtername] = self.set_bandpass_from_filter(filtername)
+                    self.filterset.add(filtername)
                 self.filter2channel_map[filtername] = channel
 
+        # Resample the transmission and per-channel CCD QE onto the common
+        # wavelength grid once so throughput_fast() is a plain product. Filters
+        # are resampled on first use in throughput_fast()
+        self._wavelengths = wavelengths
+        self._transmission_array = self._transmission_on_grid(wavelengths)
+        self._ccd_arrays = OrderedDict()
+        for channel, camera in self.channelset.items():
+            self._ccd_arrays[channel] = self._ccd_qe_on_grid(camera.ccd_qe, wavelengths)
+        self._filter_arrays = OrderedDict()
+        # Rows of the throughput matrix, added as filters are requested
+        self._tp_matrix = None
+        self._filter_index = OrderedDict()
+
+    @property
+    def transmission(self):
+        if self._transmission is None:
+            # Only made when first asked for; internally the scalar is used
+            self._transmission = _flat_spectral_element(self.transmission_scalar)
+        return self._transmission
+
+    @transmission.setter
+    def transmission(self, transmission):
+        if isinstance(transmission, BaseUnitlessSpectrum):
+            self.transmission_scalar = None
+            self._transmission = transmission
+        elif isinstance(transmission, (numbers.Number, u.Quantity)) and np.ndim(transmission) == 0:
+            self.transmission_scalar = float(u.Quantity(transmission, u.dimensionless_unscaled).value)
+            self._transmission = None
+        else:
+            raise ETCError('Invalid transmission; must be a number or a BaseUnitlessSpectrum')
+        # Resample and drop anything computed from the old transmission
+        self._transmission_array = self._transmission_on_grid(self._wavelengths)
+        self._tp_matrix = None
+        self._filter_index = OrderedDict()
+
     @property
     def channels(self):
         return self.channelset.values()
@@ -499,14 +698,7 @@ class Instrument:
         file with header and data)
         Returns an empty header dictionary and the wavelength and trensmission columns"""
 
-        table = QTable.read(csv_filter, format='ascii.csv', header_start=0, data_start=64)
-        table.rename_column('ILDIALCT', 'Wavelength')
-        table['Wavelength'].unit = u.nm
-        table.rename_column('ilab_v1', 'Trans_measured')
-        table['Trans_measured'].unit = u.dimensionless_unscaled
-        table.rename_column('FITS/CSV file dialect', 'Trans_filtered')
-
-        return {}, table['Wavelength'], table['Trans_measured']
+        return read_lco_filter_csv(csv_filter)
 
 
     def set_bandpass_from_filter(self, filtername):
@@ -515,34 +707,61 @@ class Instrument:
         Returns a SpectralElement instance for the filter profile
         """
 
-        if len(filtername) == 2 and filtername[1] == 'p':
-            filtername = filtername[0]
-
-        filename =  conf.mapping.get(filtername, None)
-        if filename is None:
-            raise ETCError('Filter name {0} is invalid.'.format(filtername))
-        if 'LCO_' in filename().upper() and '.csv' in filename().lower():
-            file_path = pkg_resources.files('etc.data').joinpath(os.path.expandvars(filename()))
+        filtername = _map_filtername(filtername)
+        filename = conf.mapping[filtername]
+        # Resolve the ConfigItem value once
+        fname_str = filename()
+        fname_lower = fname_str.lower()
+        if 'LCO_' in fname_str.upper() and '.csv' in fname_lower:
+            file_path = str(_DATA_ROOT.joinpath(os.path.expandvars(fname_str)))
+            mtime = os.path.getmtime(file_path)
             source = "LCO iLab format"
-            header, wavelengths, throughput  = self._read_lco_filter_csv(file_path)
-        elif 'http://svo' in filename().lower():
+            loader = _load_lco_csv
+        elif 'http://svo' in fname_lower:
+            file_path = fname_str
+            mtime = None
             source = "SVO filter service"
-            header, wavelengths, throughput = specio.read_remote_spec(filename(), wave_unit=u.AA, flux_unit=units.THROUGHPUT)
+            loader = _load_remote
         else:
+            file_path = str(_DATA_ROOT.joinpath(os.path.expandvars(fname_str)))
+            mtime = os.path.getmtime(file_path)
             source = "local file"
-            file_path = pkg_resources.files('etc.data').joinpath(os.path.expandvars(filename()))
-            warnings.simplefilter('ignore', category = AstropyUserWarning)
-            header, wavelengths, throughput = specio.read_ascii_spec(file_path, wave_unit=u.nm, flux_unit=units.THROUGHPUT)
-            if throughput.mean() > 1.0:
-                throughput /= 100.0
-                header['notes'] = 'Divided by 100.0 to convert from percentage'
+            loader = _load_ascii
+
+        cache_key = (filtername, file_path, mtime)
+        if cache_key in self._filter_cache:
+            return self._filter_cache[cache_key]
+
         print("Reading from {} for {}".format(source, filtername))
+        if loader is _load_remote:
+            header, wavelengths, throughput = loader(file_path)
+        else:
+            warnings.simplefilter('ignore', category = AstropyUserWarning)
+            header, wavelengths, throughput = loader(file_path, mtime)
+        # Copy so the cached header is not modified
+        header = dict(header)
+        if loader is _load_ascii and throughput.mean() > 1.0:
+            throughput = throughput / 100.0
+            header['notes'] = 'Divided by 100.0 to convert from percentage'
 
         header['filename'] = filename
         header['descrip'] = filename.description
         meta = {'header': header, 'expr': filtername}
 
-        return SpectralElement(Empirical1D, points=wavelengths, lookup_table=throughput, meta=meta)
+        bandpass = SpectralElement(Empirical1D, points=wavelengths, lookup_table=throughput, meta=meta)
+        self._filter_cache[cache_key] = bandpass
+
+        return bandpass
+
+    @classmethod
+    def clear_filter_cache(cls):
+        """Empties the cache of filter SpectralElements and parsed filter files
+        shared between Instrument instances"""
+
+        cls._filter_cache.clear()
+        _load_ascii.cache_clear()
+        _load_lco_csv.cache_clear()
+        _load_remote.cache_clear()
 
     def slit_vignette(self, slit_width=1*u.arcsec):
         """Compute the fraction of light entering the slit of width <slit_width>
@@ -596,8 +815,99 @@ class Instrument:
         if filtername not in self.filterlist or filtername not in self.filterset:
             raise ETCError('Filter name {0} is invalid.'.format(filtername))
 
+        if self.transmission_scalar is not None:
+            # Scale by the constant instead of resampling a flat spectrum
+            return self.filterset[filtername] * self.transmission_scalar * self.ccd_qe
         return self.filterset[filtername] * self.transmission * self.ccd_qe
 
+    def throughput_fast(self, filtername):
+        """Returns the throughput of instrument optics * filter * CCD QE as an
+        array sampled on the internal wavelength grid (`self._wavelengths`).
+        As in throughput(), the channel's own optics are not included; see
+        _build_throughput_matrix() for that"""
+
+        if filtername not in self.filterlist or filtername not in self.filterset:
+            raise ETCError('Filter name {0} is invalid.'.format(filtername))
+
+        filter_array = self._filter_arrays.get(filtername)
+        if filter_array is None:
+            filter_array = self._element_on_grid(self.filterset[filtername], self._wavelengths)
+            self._filter_arrays[filtername] = filter_array
+        channel = self.filter2channel_map.get(filtername, 'default')
+        ccd_array = self._ccd_arrays.get(channel, next(iter(self._ccd_arrays.values())))
+
+        return _mul3(filter_array, self._transmission_array, ccd_array)
+
+    def _camera_for_filter(self, filtername):
+        """Returns the Camera for the channel that <filtername> is in (the
+        first channel is used for filters not assigned to a channel)"""
+
+        channel = self.filter2channel_map.get(filtername, 'default')
+        return self.channelset.get(channel, next(iter(self.channelset.values())))
+
+    def _build_throughput_matrix(self, filternames=None):
+        """Returns a (n_filters, n_wavelengths) array of the throughput on
+        `self._wavelengths` of each of [filternames] (defaults to all filters).
+        Unlike throughput_fast() this includes the channel's own optics:
+        instrument optics * filter * channel optics * CCD QE.
+        Rows are kept in `self._tp_matrix` (indexed by `self._filter_index`)
+        and only filters not already in it are read and added"""
+
+        if filternames is None:
+            filternames = list(self.filterset)
+        new_filters = [f for f in OrderedDict.fromkeys(filternames) if f not in self._filter_index]
+        if len(new_filters) > 0:
+            for filtername in new_filters:
+                if filtername not in self.filterlist or filtername not in self.filterset:
+                    raise ETCError('Filter name {0} is invalid.'.format(filtername))
+            # Read any outstanding filters concurrently
+            self.filterset.load(new_filters)
+            rows = np.empty((len(new_filters), self._wavelengths.size), dtype=np.float64)
+            for i, filtername in enumerate(new_filters):
+                camera = self._camera_for_filter(filtername)
+                rows[i] = self.throughput_fast(filtername) * self._element_on_grid(camera.transmission, self._wavelengths)
+                self._filter_index[filtername] = len(self._filter_index)
+            if self._tp_matrix is None:
+                self._tp_matrix = rows
+            else:
+                self._tp_matrix = np.vstack((self._tp_matrix, rows))
+
+        if len(filternames) == 0:
+            return np.empty((0, self._wavelengths.size), dtype=np.float64)
+        return self._tp_matrix[[self._filter_index[f] for f in filternames]]
+
+    def _transmission_on_grid(self, wavelengths):
+        """Returns the instrument transmission as an array sampled at <wavelengths>"""
+
+        if self.transmission_scalar is not None:
+            return np.full(wavelengths.size, self.transmission_scalar, dtype=np.float64)
+        return self._element_on_grid(self._transmission, wavelengths)
+
+    def _ccd_qe_on_grid(self, ccd_qe, wavelengths):
+        """Returns the passed <ccd_qe> (either a BaseUnitlessSpectrum or a
+        constant) as an array sampled at <wavelengths>"""
+
+        if isinstance(ccd_qe, BaseUnitlessSpectrum):
+            return self._element_on_grid(ccd_qe, wavelengths)
+        return np.full(wavelengths.size, float(ccd_qe), dtype=np.float64)
+
+    @staticmethod
+    def _resample(wl_src, vals_src):
+        """Linearly interpolates <vals_src>, tabulated at wavelengths <wl_src>,
+        onto the default wavelength grid with np.interp"""
+
+        return np.interp(_DEFAULT_WL_NM, wl_src.to_value(u.nm), np.asarray(vals_src, dtype=np.float64))
+
+    def _element_on_grid(self, element, wavelengths):
+        """Returns the spectral <element> sampled at <wavelengths>. Tabulated
+        (Empirical1D) elements on the default grid are resampled directly from
+        their lookup table by _resample() rather than through synphot"""
+
+        if wavelengths is _DEFAULT_WL_GRID and isinstance(element.model, Empirical1D):
+            wl_src = element.model.points[0] * element._internal_wave_unit
+            return self._resample(wl_src, element.model.lookup_table)
+        return element(wavelengths).value
+
     def central_wavelength(self, n):
         """Compute central wavelength for the passed order <n>"""
 
@@ -624,11 +934,11 @@ class Instrument:
         see e.g. https://www.newport.com/n/optical-materials"""
 
         # Air-glass interfaces:
-        throughput = self.ar_coating**self.num_ar_coatings
+        throughput = _ipow(self.ar_coating, self.num_ar_coatings)
         # Transmissive optical elements
-        throughput *= self.lens_trans**self.num_lenses
+        throughput *= _ipow(self.lens_trans, self.num_lenses)
         # Reflective optical elements (Mirrors):
-        throughput *= self.mirror_refl**self.num_mirrors
+        throughput *= _ipow(self.mirror_refl, self.num_mirrors)
 
         return throughput
 
@@ -659,18 +969,18 @@ class Camera:
 
         # Read common components first
         trans_components = kwargs.get('trans_components',  None)
-        wavelengths = np.arange(300, 1501, 1) * u.nm
+        wavelengths = _DEFAULT_WL_GRID
         if trans_components:
             print("Computing channel transmission from components")
-            trans = len(wavelengths) * [1.0,]
+            trans = np.ones(wavelengths.size, dtype=np.float64)
             for comp_name in trans_components.split(","):
                 print(comp_name)
                 element = read_element(comp_name)
-                trans *= element(wavelengths)
+                trans = trans * element(wavelengths)
         else:
             print("Computing channel transmission from elements")
             transmission = self._compute_transmission()
-            trans = len(wavelengths) * [transmission,]
+            trans = np.full(wavelengths.size, transmission, dtype=np.float64)
         header = {}
         self.transmission = SpectralElement(Empirical1D, points=wavelengths, lookup_table=trans, keep_neg=True, meta={'header': header})
 
@@ -678,8 +988,8 @@ class Camera:
         if not isinstance(ccd_qe, (u.Quantity, numbers.Number)):
             file_path = os.path.expandvars(ccd_qe)
             if not os.path.exists(file_path):
-                file_path = str(pkg_resources.files('etc.data').joinpath(ccd_qe))
-            header, wavelengths, throughput = specio.read_ascii_spec(file_path, wave_unit=u.nm, flux_unit=units.THROUGHPUT)
+                file_path = str(_DATA_ROOT.joinpath(ccd_qe))
+            header, wavelengths, throughput = _read_ascii_fast(file_path)
             if throughput.mean() > 1.0:
                 throughput /= 100.0
                 header['notes'] = 'Divided by 100.0 to convert from percentage'
@@ -736,10 +1046,10 @@ class Camera:
         see e.g. https://www.newport.com/n/optical-materials"""
 
         # Air-glass interfaces:
-        throughput = self.ar_coating**self.num_ar_coatings
+        throughput = _ipow(self.ar_coating, self.num_ar_coatings)
         # Transmissive optical elements
-        throughput *= self.lens_trans**self.num_lenses
+        throughput *= _ipow(self.lens_trans, self.num_lenses)
         # Reflective optical elements (Mirrors):
-        throughput *= self.mirror_refl**self.num_mirrors
+        throughput *= _ipow(self.mirror_refl, self.num_mirrors)
 
         return throughput
@@ -458,6 +458,47 @@ class TestCCDSNR:
         assert execinfo.type == ETCError
         assert execinfo.value.args[0] == "Filter name Vibble is invalid."
 
+    def test_LCO_1m_1s_V15_batch(self):
+        expected_snr = 10.4210644
+
+        test_etc = etc.ETC(self.test_config_file)
+
+        snr = test_etc.ccd_snr_batch(1, [15,], ['V',])
+
+        assert snr.shape == (1, 1)
+        # The batch integrates on the 1nm grid rather than synphot's merged
+        # waveset; the two differ by up to ~4e-4 (in U, across the Balmer jump)
+        assert_quantity_allclose(expected_snr, snr[0, 0], rtol=2e-3)
+
+    def test_LCO_1m_1s_batch_all_filters(self):
+
+        test_etc = etc.ETC(self.test_config_file)
+
+        snr = test_etc.ccd_snr_batch(1, [14, 15, 16], sky_mag=21.8)
+
+        assert snr.shape == (len(test_etc.instrument.filterlist), 3)
+        assert (snr[:, 0] > snr[:, 1]).all()
+        assert (snr[:, 1] > snr[:, 2]).all()
+        assert_quantity_allclose(test_etc.ccd_snr(1, 15, 'V', sky_mag=21.8), snr[2, 1], rtol=2e-3)
+
+    def test_LCO_1m_1s_batch_bad_filter(self):
+
+        test_etc = etc.ETC(self.test_config_file)
+
+        with pytest.raises(Exception) as execinfo:
+            snr = test_etc.ccd_snr_batch(1, [15,], ['V', 'Vibble'])
+
+        assert execinfo.type == ETCError
+        assert execinfo.value.args[0] == "Filter name Vibble is invalid."
+
+    def test_LCO_1m_1s_batch_no_filters(self):
+
+        test_etc = etc.ETC(self.test_config_file)
+
+        snr = test_etc.ccd_snr_batch(1, [15, 16], [])
+
+        assert snr.shape == (0, 2)
+
     def test_LCO_1m_1s_V15(self):
         expected_snr = 10.4210644
 
@@ -6,10 +6,11 @@ import toml
 from astropy import units as u
 warnings.simplefilter("ignore", pytest.PytestUnknownMarkWarning)
 from astropy.tests.helper import assert_quantity_allclose
-from synphot import units
+from synphot import units, specio
 from synphot.spectrum import SpectralElement, BaseUnitlessSpectrum, SourceSpectrum
 
 from etc.models import *
+from etc.models import _read_ascii_fast
 from etc.utils import ETCError
 
 class TestSite:
@@ -49,6 +50,14 @@ class TestSite:
         assert site.longitude == -119.86 * u.deg
         assert site.tpeak() == 0.9
 
+    def test_mul_does_not_modify(self):
+        site = Site(name="BPL", transmission=0.9)
+
+        new_site = site * 0.5
+        assert new_site is not site
+        assert_quantity_allclose(site.tpeak(), 0.9)
+        assert_quantity_allclose(new_site.tpeak(), 0.45)
+
     def test_transmission_file(self):
         test_config = { 'name' : "BPL",
                         'altitude' : 7,
@@ -277,6 +286,13 @@ class TestTelescope:
         assert tel.area == 0 * u.m * u.m
         assert tel.num_mirrors == 2
 
+    def test_no_instance_dict(self):
+        tel = Telescope()
+
+        assert not hasattr(tel, '__dict__')
+        with pytest.raises(AttributeError):
+            tel.mirror_count = 3
+
     def test_initialize1(self):
         tel = Telescope(name="FTN", size=2.0, area=2.574, num_mirrors=3)
 
@@ -296,6 +312,20 @@ class TestTelescope:
         assert tel.num_mirrors == 2
         assert tel.tpeak() == 0.8 * 0.8
 
+    def test_mul_does_not_modify(self):
+        tel = Telescope(name="FTN", size=2.0, area=2.574, num_mirrors=3)
+        orig_reflectivity = tel.reflectivity
+
+        new_tel = tel * 0.5
+        assert new_tel is not tel
+        assert tel.reflectivity is orig_reflectivity
+        assert_quantity_allclose(tel.tpeak(), 0.85**3)
+        assert_quantity_allclose(new_tel.tpeak(), 0.5 * 0.85**3)
+
+        new_tel = tel / 2.0
+        assert tel.reflectivity is orig_reflectivity
+        assert_quantity_allclose(new_tel.tpeak(), 0.5 * 0.85**3)
+
     def test_reflectivity_file(self):
         test_config = { 'name' : "BPL 1-m",
                         'size' : 1,
@@ -310,6 +340,19 @@ class TestTelescope:
         assert tel.num_mirrors == 2
         assert tel.tpeak() == 0.92**2
 
+    def test_reflectivity_file_3mirrors(self):
+        test_config = { 'name' : "FTN",
+                        'size' : 2,
+                        'area' : 2.574,
+                        'num_mirrors' : 3,
+                        'reflectivity' : os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_mirror.dat"))
+                      }
+        tel = Telescope(**test_config)
+
+        assert tel.num_mirrors == 3
+        assert isinstance(tel.reflectivity, BaseUnitlessSpectrum)
+        assert_quantity_allclose(tel.tpeak(), 0.92**3)
+
     def test_reflectivity_list(self):
         test_fp = os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_mirror.dat"))
 
@@ -326,6 +369,17 @@ class TestTelescope:
         assert tel.num_mirrors == 2
         assert tel.tpeak() == 0.92**2
 
+    def test_reflectivity_list_too_short(self):
+        test_fp = os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_mirror.dat"))
+
+        test_config = { 'name' : "FTN",
+                        'num_mirrors' : 3,
+                        'reflectivity' : [test_fp, test_fp]
+                      }
+        with pytest.raises(ETCError) as execinfo:
+            tel = Telescope(**test_config)
+        assert '3 mirrors' in str(execinfo.value)
+
 class TestInstrument:
 
     def test_initialize_defaults(self):
@@ -363,6 +417,49 @@ class TestInstrument:
         assert inst.filterlist == []
 
         assert inst.transmission.tpeak() == 0.911493 # 0.93 (lens) * 0.99^2 (AR)
+        assert_quantity_allclose(inst.transmission_scalar, 0.911493)
+        assert not hasattr(inst, '__dict__')
+
+    def test_trans_mirrors(self):
+        inst = Instrument(num_inst_mirrors=3)
+
+        assert inst.num_mirrors == 3
+        assert_quantity_allclose(inst.transmission_scalar, 0.911493 * 0.9925**3)
+
+    def test_trans_scalar_lazy(self):
+        inst = Instrument()
+        inst2 = Instrument()
+
+        assert inst._transmission is None
+        assert inst.transmission is inst.transmission
+        assert inst.transmission is not inst2.transmission
+        inst.transmission.meta['header']['notes'] = 'Modified'
+        assert 'notes' not in inst2.transmission.meta['header']
+
+    def test_trans_set(self):
+        optics_options = { 'filterlist' : ['r',] }
+        inst = Instrument(**optics_options)
+        inst._build_throughput_matrix()
+
+        trans = inst.transmission * 0.5
+        inst.transmission = trans
+        assert inst.transmission is trans
+        assert inst.transmission_scalar is None
+        assert inst._tp_matrix is None
+        assert_quantity_allclose(inst.throughput_fast('r'), inst.throughput('r')(inst._wavelengths).value)
+
+        inst.transmission = 0.8
+        assert inst.transmission_scalar == 0.8
+        assert_quantity_allclose(inst.transmission.tpeak(), 0.8)
+
+        inst.transmission = 0.7 * u.dimensionless_unscaled
+        assert inst.transmission_scalar == 0.7
+        assert_quantity_allclose(inst.throughput_fast('r'), inst.throughput('r')(inst._wavelengths).value)
+
+        with pytest.raises(ETCError):
+            inst.transmission = [0.8, 0.9]
+        with pytest.raises(u.UnitConversionError):
+            inst.transmission = 0.8 * u.m
 
     def test_trans_modify_optics(self):
         optics_options = { 'inst_lens_trans' : 0.85,
@@ -403,6 +500,16 @@ class TestInstrument:
         assert len(inst.filterset) == 5
         assert isinstance(inst.filterset['g'], SpectralElement)
 
+    def test_filterset_order(self):
+
+        optics_options = {  'filterlist' : ['z', 'u', 'i', 'g', 'r'],
+                         }
+        inst = Instrument(**optics_options)
+
+        assert list(inst.filterset.keys()) == ['z', 'u', 'i', 'g', 'r']
+        for filtername, bandpass in inst.filterset.items():
+            assert bandpass is inst.set_bandpass_from_filter(filtername)
+
     def test_filterset_primenotation(self):
 
         optics_options = {  'filterlist' : ['up', 'gp', 'rp', 'ip', 'zs'],
@@ -428,6 +535,62 @@ class TestInstrument:
         assert inst.filterset['r'].meta['header']['descrip'] != inst.filterset['R'].meta['header']['descrip']
         assert inst.filterset['r'].meta['expr'] != inst.filterset['R'].meta['expr']
 
+    def test_filterset_cached(self):
+
+        optics_options = { 'filterlist' : ['r', 'g'],
+                         }
+
+        inst1 = Instrument(**optics_options)
+        inst2 = Instrument(**optics_options)
+
+        assert inst1.filterset['r'] is inst2.filterset['r']
+        assert inst1.filterset['g'] is inst2.filterset['g']
+        assert inst1.filterset['r'] is not inst1.filterset['g']
+
+    def test_filterset_clear_cache(self):
+
+        optics_options = { 'filterlist' : ['r',],
+                         }
+
+        inst1 = Instrument(**optics_options)
+        bandpass1 = inst1.filterset['r']
+        Instrument.clear_filter_cache()
+        assert len(Instrument._filter_cache) == 0
+        inst2 = Instrument(**optics_options)
+
+        assert bandpass1 is not inst2.filterset['r']
+        assert_quantity_allclose(bandpass1.tpeak(), inst2.filterset['r'].tpeak())
+
+    def test_filterset_lazy(self):
+
+        optics_options = { 'filterlist' : ['r', 'g'],
+                         }
+        Instrument.clear_filter_cache()
+        inst = Instrument(**optics_options)
+
+        assert len(Instrument._filter_cache) == 0
+        assert list(inst.filterset) == ['r', 'g']
+        assert 'g' in inst.filterset
+        assert isinstance(inst.filterset['g'], SpectralElement)
+        assert len(Instrument._filter_cache) == 1
+        inst.filterset.load_all()
+        assert len(Instrument._filter_cache) == 2
+
+    def test_filterset_invalid(self):
+
+        optics_options = { 'filterlist' : ['r', 'Vibble'],
+                         }
+        with pytest.raises(ETCError) as execinfo:
+            inst = Instrument(**optics_options)
+        assert 'Vibble' in str(execinfo.value)
+
+    def test_filterset_invalid_channel(self):
+
+        optics_options = { 'channels' : {'channel1' : {'filterlist' : ['gp', 'Vibble']}}
+                         }
+        with pytest.raises(ETCError):
+            inst = Instrument(**optics_options)
+
     def test_throughput(self):
 
         optics_options = { 'filterlist' : ['r',] }
@@ -480,6 +643,162 @@ class TestInstrument:
         assert isinstance(inst.ccd_qe, BaseUnitlessSpectrum)
         assert_quantity_allclose(inst.throughput('r').tpeak(), 0.8856121333333334, 1e-5)
 
+    def test_throughput_fast(self):
+
+        optics_options = { 'filterlist' : ['r',] }
+
+        inst = Instrument(**optics_options)
+
+        throughput = inst.throughput_fast('r')
+        assert throughput.shape == inst._wavelengths.shape
+        assert_quantity_allclose(throughput, inst.throughput('r')(inst._wavelengths).value)
+
+    def test_resample(self):
+        waves = [400, 500, 600] * u.nm
+        vals = [0.0, 1.0, 0.5]
+
+        resampled = Instrument._resample(waves, vals)
+
+        assert resampled.shape == (1201,)
+        assert_quantity_allclose(resampled[[0, 150, 200, 250, 1200]], [0.0, 0.5, 1.0, 0.75, 0.5])
+
+    def test_throughput_fast_ccd_qe_file(self):
+
+        optics_options = { 'filterlist' : ['r',],
+                           'ccd_qe'  : os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_ccd_qe.dat"))
+                         }
+
+        inst = Instrument(**optics_options)
+
+        throughput = inst.throughput_fast('r')
+        assert_quantity_allclose(throughput, inst.throughput('r')(inst._wavelengths).value)
+
+    def test_read_ascii_fast(self):
+        test_fp = os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_ccd_qe.dat"))
+
+        header, wavelengths, throughput = _read_ascii_fast(test_fp)
+        expected = specio.read_ascii_spec(test_fp, wave_unit=u.nm, flux_unit=units.THROUGHPUT)
+
+        assert header == {}
+        assert_quantity_allclose(wavelengths, expected[1])
+        assert_quantity_allclose(throughput, expected[2])
+
+    def test_read_ascii_fast_pandas(self, monkeypatch):
+        pytest.importorskip('pandas')
+        test_fp = os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_ccd_qe.dat"))
+        expected = specio.read_ascii_spec(test_fp, wave_unit=u.nm, flux_unit=units.THROUGHPUT)
+
+        def no_fallback(*args, **kwargs):
+            raise AssertionError('Fell back to specio.read_ascii_spec')
+        monkeypatch.setattr(specio, 'read_ascii_spec', no_fallback)
+
+        header, wavelengths, throughput = _read_ascii_fast(test_fp)
+
+        assert header == {}
+        assert wavelengths.unit == u.nm
+        assert_quantity_allclose(wavelengths, expected[1])
+        assert_quantity_allclose(throughput, expected[2])
+
+    def test_read_ascii_fast_single_column(self, monkeypatch, tmp_path):
+        pytest.importorskip('pandas')
+        test_fp = tmp_path / 'single_column.dat'
+        test_fp.write_text('# Wavelength only\n300\n350\n400\n')
+        monkeypatch.setattr(specio, 'read_ascii_spec', lambda *args, **kwargs: 'fallback')
+
+        assert _read_ascii_fast(str(test_fp)) == 'fallback'
+
+    def test_read_ascii_fast_no_pandas(self, monkeypatch):
+        test_fp = os.path.abspath(os.path.join(__package__, 'etc', "tests", "data", "test_ccd_qe.dat"))
+        monkeypatch.setattr('etc.models.pd', None)
+
+        header, wavelengths, throughput = _read_ascii_fast(test_fp)
+
+        assert_quantity_allclose(wavelengths[0:2], [300, 350]*u.nm)
+        assert_quantity_allclose(throughput[0:2], [65, 75])
+
+    def test_read_ascii_fast_text_header(self, tmp_path):
+        test_fp = tmp_path / 'text_header.dat'
+        test_fp.write_text('Wavelength QE\n300 65\n350 75\n400 80\n')
+
+        header, wavelengths, throughput = _read_ascii_fast(str(test_fp))
+
+        assert_quantity_allclose(wavelengths, [300, 350, 400]*u.nm)
+        assert_quantity_allclose(throughput, [65, 75, 80])
+
+    def test_throughput_matrix(self):
+
+        optics_options = { 'filterlist' : ['g', 'r', 'i'] }
+
+        inst = Instrument(**optics_options)
+
+        tp_matrix = inst._build_throughput_matrix()
+        assert tp_matrix.shape == (3, inst._wavelengths.size)
+        assert list(inst._filter_index) == ['g', 'r', 'i']
+        # No channel optics by default so the rows match throughput_fast()
+        for filtername, row in inst._filter_index.items():
+            assert_quantity_allclose(tp_matrix[row], inst.throughput_fast(filtername))
+
+    def test_throughput_matrix_no_filters(self):
+        inst = Instrument()
+
+        tp_matrix = inst._build_throughput_matrix()
+        assert tp_matrix.shape == (0, inst._wavelengths.size)
+        tp_matrix = inst._build_throughput_matrix([])
+        assert tp_matrix.shape == (0, inst._wavelengths.size)
+
+    def test_throughput_matrix_channel_optics(self):
+
+        optics_options = { 'filterlist' : ['g', 'r'],
+                           'num_chan_lenses' : 1,
+                           'num_chan_ar_coatings' : 2
+                         }
+
+        inst = Instrument(**optics_options)
+        camera = inst._camera_for_filter('r')
+        camera_trans = camera.transmission(inst._wavelengths).value
+        assert_quantity_allclose(camera_trans, 0.93 * 0.99**2)
+
+        tp_matrix = inst._build_throughput_matrix()
+        for filtername, row in inst._filter_index.items():
+            expected = inst.throughput_fast(filtername) * camera_trans
+            assert_quantity_allclose(tp_matrix[row], expected)
+            assert tp_matrix[row].max() < inst.throughput_fast(filtername).max()
+
+    def test_throughput_matrix_subset(self):
+
+        optics_options = { 'filterlist' : ['g', 'r', 'i'] }
+
+        Instrument.clear_filter_cache()
+        inst = Instrument(**optics_options)
+
+        tp = inst._build_throughput_matrix(['r'])
+        assert tp.shape == (1, inst._wavelengths.size)
+        assert list(inst._filter_index) == ['r']
+        # Only the requested filter is read
+        assert len(Instrument._filter_cache) == 1
+
+        tp_matrix = inst._tp_matrix
+        tp = inst._build_throughput_matrix(['r'])
+        assert inst._tp_matrix is tp_matrix
+
+        tp = inst._build_throughput_matrix(['i', 'r'])
+        assert list(inst._filter_index) == ['r', 'i']
+        assert inst._tp_matrix.shape == (2, inst._wavelengths.size)
+        assert_quantity_allclose(tp[1], tp_matrix[0])
+        assert_quantity_allclose(tp[0], inst.throughput_fast('i'))
+
+        with pytest.raises(ETCError):
+            inst._build_throughput_matrix(['V'])
+
+    def test_throughput_fast_badfilter(self):
+
+        optics_options = { 'filterlist' : ['r',] }
+
+        inst = Instrument(**optics_options)
+
+        with pytest.raises(ETCError):
+            inst.throughput_fast('g')
+
     def test_ccd_parameters(self):
         expected_gain = 0.9 * (u.electron / u.adu)
         expected_noise = 4.0 * (u.electron / u.pix)
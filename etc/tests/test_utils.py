@@ -9,7 +9,7 @@ from astropy.tests.helper import assert_quantity_allclose
 from synphot.spectrum import SpectralElement, BaseUnitlessSpectrum, SourceSpectrum
 from synphot import units
 
-from etc.utils import read_element, read_eso_spectra, percentage_difference
+from etc.utils import read_element, read_eso_spectra, percentage_difference, read_lco_filter_csv
 
 class TestReadElement:
 
@@ -151,6 +151,29 @@ class TestReadElement:
         assert_quantity_allclose(element(element.waveset[-1]), 0.0)
         assert_quantity_allclose(element(530*u.nm), 1.0)
 
+    def test_config_item_LCO_csv(self):
+        element = read_element('C2')
+
+        assert type(element) == SpectralElement
+        assert_quantity_allclose(element.waveset[0], 275 * u.nm)
+        assert_quantity_allclose(element.waveset[-1], 1225 * u.nm)
+
+
+class TestReadLCOFilterCSV():
+
+    def test_read(self):
+        test_fp = os.path.abspath(os.path.join(__package__, 'etc', "data", "comp", "lco", "LCO_ESA_C2.csv"))
+
+        header, wavelengths, throughput = read_lco_filter_csv(test_fp)
+
+        assert header == {}
+        assert len(wavelengths) == 951
+        assert len(throughput) == 951
+        assert wavelengths.unit == u.nm
+        assert throughput.unit == u.dimensionless_unscaled
+        assert_quantity_allclose(wavelengths[0], 275 * u.nm)
+        assert_quantity_allclose(throughput[0], 2.822490e-06)
+
 
 class TestReadESOSpectra():
 
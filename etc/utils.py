@@ -16,7 +16,6 @@ from astropy import units as u
 from astropy.io import fits
 from astropy.wcs import WCS
 from astropy.wcs import FITSFixedWarning
-from astropy.table import QTable
 from astropy.utils.exceptions import AstropyUserWarning
 import numpy as np
 from synphot import units, SourceSpectrum, SpectralElement, specio
@@ -120,14 +119,13 @@ def read_lco_filter_csv(csv_filter):
     file with header and data)
     Returns an empty header dictionary and the wavelength and transmission columns"""
 
-    table = QTable.read(csv_filter, format='ascii.csv', header_start=0, data_start=64)
-    table.rename_column('ILDIALCT', 'Wavelength')
-    table['Wavelength'].unit = u.nm
-    table.rename_column('ilab_v1', 'Trans_measured')
-    table['Trans_measured'].unit = u.dimensionless_unscaled
-    table.rename_column('FITS/CSV file dialect', 'Trans_filtered')
+    # Data (wavelength [nm], measured and filtered transmission) start after
+    # the 64 header and measurement parameter lines
+    data = np.loadtxt(csv_filter, delimiter=',', skiprows=64, usecols=(0, 1), unpack=True)
+    wavelengths = data[0] * u.nm
+    throughput = data[1] * u.dimensionless_unscaled
 
-    return {}, table['Wavelength'], table['Trans_measured']
+    return {}, wavelengths, throughput
 
 def get_x_units(x_data):
     """finds wavelength units from x_data
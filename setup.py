@@ -4,6 +4,8 @@ with open("README.md", "r") as readme_file:
     readme = readme_file.read()
 
 requirements = ["astropy>=4.0", "toml", "synphot>=0.3"]
+# Optional faster file parsing (pandas) and compiled kernels (numba)
+extras = {"fast": ["pandas", "numba"]}
 
 setup(
     name="etc",
@@ -16,6 +18,7 @@ setup(
     url="https://github.com/talister/etc/",
     packages=find_packages(),
     install_requires=requirements,
+    extras_require=extras,
     classifiers=[
         "Programming Language :: Python :: 3.7",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",